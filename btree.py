@@ -0,0 +1,207 @@
+"""A toy B-tree, an alternative ordered map to the skiplist.
+
+Where the skiplist hops between single key nodes, each B-tree node holds a
+sorted block of keys and we use `bisect` to find which child to go down into.
+With 16 way branching the tree is about `log16 N` deep, roughly 4x fewer
+pointer hops than the `log2 N` levels of the skiplist, and the tree shape
+doesn't depend on random levels.
+
+Insert and delete both work in a single pass down the tree. Insert splits any
+full node before moving into it, so there is always room to push a key up into
+the parent. Delete makes sure any node it moves into has at least `t` keys (by
+borrowing from a sibling or merging with one), so a key can always be removed
+without the node underflowing.
+"""
+
+import bisect
+import dataclasses
+from typing import List, Tuple
+
+from skip_list import K, V
+
+
+@dataclasses.dataclass
+class BTreeNode:
+  """A node in the B-tree, leaves don't have children."""
+  __slots__ = ("keys", "values", "children")
+  keys: List[K]
+  values: List[V]
+  children: List['BTreeNode']
+
+  @property
+  def leaf(self) -> bool:
+    return not self.children
+
+
+@dataclasses.dataclass
+class BTreeMap:
+  """B-tree.
+
+  Each node has at most `branching` children and `branching - 1` keys, every
+  node other than the root has at least `branching // 2 - 1` keys. Unlike
+  `SkipList`, inserting an existing key replaces its value.
+  """
+
+  root: BTreeNode = dataclasses.field(
+      default_factory=lambda: BTreeNode([], [], []))
+  size: int = 0
+  branching: int = 16
+
+  def __post_init__(self):
+    # With fewer than 4 children a node at the minimum has no keys to give up.
+    if self.branching < 4:
+      raise ValueError(
+          f"branching must be at least 4, got {self.branching}")
+
+  def __len__(self):
+    """The length of the tree is tracked with size."""
+    return self.size
+
+  def __getitem__(self, k: K) -> V:
+    x = self.root
+    while True:
+      i = bisect.bisect_left(x.keys, k)
+      if i < len(x.keys) and x.keys[i] == k:
+        return x.values[i]
+      # We hit the bottom without finding the key.
+      if x.leaf:
+        raise KeyError(k)
+      # Everything in children[i] is between keys[i - 1] and keys[i].
+      x = x.children[i]
+
+  def _split_child(self, x: BTreeNode, i: int):
+    """Split the full child `i` of `x` in two, moving the middle key up."""
+    t = self.branching // 2
+    y = x.children[i]
+    z = BTreeNode(y.keys[t:], y.values[t:], y.children[t:])
+    x.keys.insert(i, y.keys[t - 1])
+    x.values.insert(i, y.values[t - 1])
+    x.children.insert(i + 1, z)
+    del y.keys[t - 1:]
+    del y.values[t - 1:]
+    del y.children[t:]
+
+  def insert(self, key: K, value: V) -> 'BTreeMap':
+    # If the root is full split it, this is the only way the tree gets taller.
+    if len(self.root.keys) == self.branching - 1:
+      self.root = BTreeNode([], [], [self.root])
+      self._split_child(self.root, 0)
+
+    x = self.root
+    while True:
+      i = bisect.bisect_left(x.keys, key)
+      if i < len(x.keys) and x.keys[i] == key:
+        x.values[i] = value
+        return self
+      # We only add keys at the leaves, we know there is room as we split full
+      # nodes on the way down.
+      if x.leaf:
+        x.keys.insert(i, key)
+        x.values.insert(i, value)
+        self.size += 1
+        return self
+      if len(x.children[i].keys) == self.branching - 1:
+        self._split_child(x, i)
+        # The middle key of the child is now at `i`, check which half we go in.
+        if x.keys[i] == key:
+          x.values[i] = value
+          return self
+        if x.keys[i] < key:
+          i += 1
+      x = x.children[i]
+
+  def _merge(self, x: BTreeNode, i: int):
+    """Merge child `i + 1` and key `i` of `x` into child `i`."""
+    left = x.children[i]
+    right = x.children.pop(i + 1)
+    left.keys.append(x.keys.pop(i))
+    left.values.append(x.values.pop(i))
+    left.keys.extend(right.keys)
+    left.values.extend(right.values)
+    left.children.extend(right.children)
+
+  def _fill(self, x: BTreeNode, i: int) -> int:
+    """Make sure child `i` of `x` has at least `t` keys.
+
+    Returns the index of the child that now holds the keys of child `i`, this
+    changes when we have to merge it into its left sibling.
+    """
+    t = self.branching // 2
+    child = x.children[i]
+    # Borrow a key from the left sibling, rotating through the parent.
+    if i > 0 and len(x.children[i - 1].keys) >= t:
+      left = x.children[i - 1]
+      child.keys.insert(0, x.keys[i - 1])
+      child.values.insert(0, x.values[i - 1])
+      x.keys[i - 1] = left.keys.pop()
+      x.values[i - 1] = left.values.pop()
+      if not left.leaf:
+        child.children.insert(0, left.children.pop())
+      return i
+    # Borrow a key from the right sibling.
+    if i < len(x.keys) and len(x.children[i + 1].keys) >= t:
+      right = x.children[i + 1]
+      child.keys.append(x.keys[i])
+      child.values.append(x.values[i])
+      x.keys[i] = right.keys.pop(0)
+      x.values[i] = right.values.pop(0)
+      if not right.leaf:
+        child.children.append(right.children.pop(0))
+      return i
+    # Both siblings are at the minimum, merge with one of them.
+    if i < len(x.keys):
+      self._merge(x, i)
+      return i
+    self._merge(x, i - 1)
+    return i - 1
+
+  @staticmethod
+  def _max(x: BTreeNode) -> Tuple[K, V]:
+    while not x.leaf:
+      x = x.children[-1]
+    return x.keys[-1], x.values[-1]
+
+  @staticmethod
+  def _min(x: BTreeNode) -> Tuple[K, V]:
+    while not x.leaf:
+      x = x.children[0]
+    return x.keys[0], x.values[0]
+
+  def delete(self, key: K) -> 'BTreeMap':
+    t = self.branching // 2
+    x = self.root
+    while True:
+      i = bisect.bisect_left(x.keys, key)
+      found = i < len(x.keys) and x.keys[i] == key
+      if x.leaf:
+        if found:
+          del x.keys[i]
+          del x.values[i]
+          self.size -= 1
+        break
+      if found:
+        left, right = x.children[i], x.children[i + 1]
+        # Replace our key with its predecessor (or successor) and then go
+        # delete that from the child it came from.
+        if len(left.keys) >= t:
+          key, x.values[i] = self._max(left)
+          x.keys[i] = key
+          x = left
+        elif len(right.keys) >= t:
+          key, x.values[i] = self._min(right)
+          x.keys[i] = key
+          x = right
+        # Otherwise our key moves down into the merged child.
+        else:
+          self._merge(x, i)
+          x = left
+        continue
+      # Make sure the child we move into can lose a key.
+      if len(x.children[i].keys) < t:
+        i = self._fill(x, i)
+      x = x.children[i]
+
+    # A merge can empty the root, then its only child becomes the new root.
+    if not self.root.keys and not self.root.leaf:
+      self.root = self.root.children[0]
+    return self
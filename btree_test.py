@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+import random
+from btree import BTreeMap
+
+import pytest
+parameterize = pytest.mark.parametrize
+
+
+def make_example_tree(branching=4):
+  tree = BTreeMap(branching=branching)
+  for key in (12, 1, 24, 7, 19, 5, 15):
+    tree.insert(key, f"{key}!")
+  return tree
+
+example_tree = pytest.fixture(make_example_tree)
+
+
+def test_find_missing_key(example_tree):
+  with pytest.raises(KeyError):
+    example_tree[100]
+
+
+@parameterize("key", (0, 14, 100))
+def test_insert(example_tree, key):
+  value = "my value"
+  example_tree = example_tree.insert(key, value)
+  assert example_tree[key] == value
+  assert len(example_tree) == 8
+
+
+def test_insert_replaces(example_tree):
+  example_tree = example_tree.insert(7, "new")
+  assert example_tree[7] == "new"
+  assert len(example_tree) == 7
+
+
+@parameterize("to_delete", (1, 5, 15, 12, 24, 100))
+def test_delete(example_tree, to_delete):
+  example_tree = example_tree.delete(to_delete)
+  with pytest.raises(KeyError):
+    example_tree[to_delete]
+
+
+@parameterize("to_find", (1, 5, 15, 12, 24))
+def test_find(example_tree, to_find):
+  assert example_tree[to_find] == f"{to_find}!"
+
+
+@parameterize("branching", (0, 2, 3))
+def test_small_branching(branching):
+  with pytest.raises(ValueError):
+    BTreeMap(branching=branching)
+
+
+@parameterize("branching", (4, 16))
+def test_matches_dict(branching):
+  rng = random.Random(branching)
+  tree = BTreeMap(branching=branching)
+  expected = {}
+  for _ in range(2000):
+    key = rng.randrange(300)
+    if rng.random() < 0.6:
+      tree.insert(key, key * 2)
+      expected[key] = key * 2
+    else:
+      tree.delete(key)
+      expected.pop(key, None)
+  assert len(tree) == len(expected)
+  for key in range(300):
+    if key in expected:
+      assert tree[key] == expected[key]
+    else:
+      with pytest.raises(KeyError):
+        tree[key]
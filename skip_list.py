@@ -5,15 +5,16 @@ The most important part of this implementation is the
 ```python
 x = self.head
 for i in range(self.level, -1, -1):
-  while True:
-    if x.next.get(i) is None or k < x.next[i].pair.key:
-      break
+  nxt = x.next[i]
+  while nxt is not None and nxt.key < k:
+    x = nxt
+    nxt = x.next[i]
 ```
 
 We begin by looping through the levels of the skip list, starting at the
 top-most level as it is the sparsist. We when hit the end of that list (or a
-key that is larger than our key value), we know that our key is not at this
-level but is one level down. So we break out of the while loop (which is what is
+key that is not smaller than our key value), we know that our key is not past
+this level but is one level down. So we exit the while loop (which is what is
 iterating through the list at some level) and the for loop drops us down one
 level. Critically, the current node `x` is not reset, this means we are still
 looking at the same node, just at a deeper level. This means that we get to
@@ -23,9 +24,13 @@ list is ordered, everything before `x` is smaller than `x` and therefore smaller
 than our key and can be ignored.
 """
 
+import array
+import bisect
 import dataclasses
+import operator
 import random
-from typing import Any, Optional, Protocol, TypeVar, Dict
+from typing import (
+    Any, ClassVar, Iterable, Iterator, List, Optional, Protocol, Tuple, TypeVar)
 
 class _Orderable(Protocol):
   def __lt__(self, other) -> bool: ...
@@ -34,23 +39,30 @@ Orderable = TypeVar("Orderable", bound=_Orderable)
 K = Orderable
 V = Any
 
+# The highest level `SkipList.get_level` will produce.
+MAX_LEVEL = 31
 
-@dataclasses.dataclass
-class Pair:
-  """Key value pair to store in the SkipList"""
-  key: K
-  value: V
+# Numba is optional, when it is installed the `IntSkipList` search and insert
+# loops are compiled, otherwise they run as plain python.
+try:
+  from numba import njit
+  _jit = njit(cache=True)
+except ImportError:
+  def _jit(f):
+    return f
 
 
 @dataclasses.dataclass
 class SkipNode:
-  """A node in the skiplist."""
-  pair: Pair
-  next: Dict[int, 'SkipNpde']  # The max key value is the node's level.
+  """A node in the skiplist, holding a key and its value."""
+  __slots__ = ("key", "value", "next")
+  key: K
+  value: V
+  next: List[Optional['SkipNode']]  # Indexed by level, len - 1 is the level.
 
   @property
   def level(self) -> int:
-    return max(self.next.keys())
+    return len(self.next) - 1
 
 
 @dataclasses.dataclass
@@ -67,45 +79,132 @@ class SkipList:
   level: int
   size: int
 
+  # Deleted nodes are kept here and reused by insert, this saves allocating a
+  # node for each insert in workloads that mix inserts and deletes.
+  _pool: ClassVar[List[SkipNode]] = []
+  _max_pool_size: ClassVar[int] = 4096
+
+  # The last inserted node and the node before it at each level, they let in
+  # order inserts start from where the last one left off.
+  _finger: Optional[SkipNode] = dataclasses.field(
+      default=None, init=False, repr=False, compare=False)
+  _finger_update: List[SkipNode] = dataclasses.field(
+      default_factory=list, init=False, repr=False, compare=False)
+
   def __len__(self):
     """The length of the list is tracked with size."""
     return self.size
 
-  def __getitem__(self, k: K) -> V:
+  def _find_ge(self, k: K) -> Tuple[Optional[SkipNode], bool]:
+    """Find the first node with a key >= `k` and if its key is `k`."""
     x = self.head
 
     # Search each level starting from the top
     for i in range(self.level, -1, -1):
-      # Most important part of this loop is that when we break from the while
-      # loop over the linked list, we will drop down a level (from the for loop)
-      # but we don't reset `x` so we are looking at the same node, just at a
-      # lower level. This means we get to skip looking at any node before `x`
-      # at this new level.
-      while True:
-        # Iterate through the LL at this level, If we hit the end (or find a key
-        # that is larger than ours) we know we aren't in this level.
-        if x.next.get(i) is None or k < x.next[i].pair.key:
-          break
-        # If we find our key, return the value. x.next[i] is defined because
-        # otherwise we would have broken above
-        elif x.next[i].pair.key == k:
-          return x.next[i].pair.value
-        # Otherwise move to the next entry. We know this entry will have a next
-        # list long enough to be indexed by this level `i` as we are only
-        # looking at the next node at this level.
-        else:
-          x = x.next[i]
+      # Most important part of this loop is that when we exit the while loop
+      # over the linked list, we will drop down a level (from the for loop) but
+      # we don't reset `x` so we are looking at the same node, just at a lower
+      # level. This means we get to skip looking at any node before `x` at this
+      # new level.
+      #
+      # Iterate through the LL at this level until we hit the end (or find a key
+      # that is not smaller than ours). The next pointer is fetched once per hop
+      # and reused for both the comparison and the advance.
+      nxt = x.next[i]
+      while nxt is not None and nxt.key < k:
+        x = nxt
+        nxt = x.next[i]
+    # `x` is now the last node smaller than `k` so the one after it is the first
+    # node that is >= `k`, or None if every key is smaller.
+    return nxt, nxt is not None and nxt.key == k
+
+  def __getitem__(self, k: K) -> V:
+    node, found = self._find_ge(k)
+    if found:
+      return node.value
     # If we didn't find the key, raise an error.
     raise KeyError(k)
 
+  def __contains__(self, k: K) -> bool:
+    return self._find_ge(k)[1]
+
+  def get(self, k: K, default: Optional[V] = None) -> Optional[V]:
+    """Get the value for `k`, returning `default` if it is missing."""
+    node, found = self._find_ge(k)
+    return node.value if found else default
+
+  def items_range(self, lo: K, hi: K) -> Iterator[Tuple[K, V]]:
+    """Iterate over the key value pairs with lo <= key < hi in order.
+
+    Deleting from the list while iterating is not supported, deleted nodes are
+    emptied and reused so the iterator may fail or yield the wrong pairs.
+    """
+    x, _ = self._find_ge(lo)
+    # The bottom level has every key so we just walk it until we pass `hi`.
+    while x is not None and x.key < hi:
+      yield x.key, x.value
+      x = x.next[0]
+
   # This isn't a staticmethod to make overriding this method easier.
   def get_level(self) -> int:
     """Select a random level to insert the new node at. P_L = 2^(-L + 1)."""
-    level = 0
-    # Make it less likely to get a higher level.
-    while random.choice([True, False]):
-      level += 1
-    return level
+    # Each bit is a coin flip, so the number of trailing zeros is geometric.
+    # `bits & -bits` isolates the lowest set bit, its bit length - 1 is the
+    # count of trailing zeros.
+    bits = random.getrandbits(MAX_LEVEL + 1)
+    # All the flips came up zero, clamp to the highest level.
+    if bits == 0:
+      return MAX_LEVEL
+    return (bits & -bits).bit_length() - 1
+
+  def _descend(self, key: K) -> List[SkipNode]:
+    """Find the last node at each level that comes before `key`."""
+    update = [self.head] * (self.level + 1)
+    x = self.head
+
+    # Find where the new node goes at each level.
+    for i in range(self.level, -1, -1):
+      # Most important part of this loop is that when we exit the while loop
+      # over the linked list, we will drop down a level (from the for loop) but
+      # we don't reset `x` so we are looking at the same node, just at a lower
+      # level. This means we get to skip looking at any node before `x` at this
+      # new level.
+      #
+      # Iterate through the until we hit the end or find a key that is not less
+      # than what we are inserting.
+      nxt = x.next[i]
+      while nxt is not None and nxt.key < key:
+        x = nxt
+        nxt = x.next[i]
+      update[i] = x
+    return update
+
+  def _link(
+      self, key: K, value: V, new_level: int, update: List[SkipNode]
+  ) -> SkipNode:
+    """Add a node after the nodes in `update` up to `new_level`."""
+    # Create a new node to hold K and V, it will be inserted at the newly
+    # choosen level. Reuse a deleted node if we have one.
+    if self._pool:
+      new_node = self._pool.pop()
+      new_node.key = key
+      new_node.value = value
+      new_node.next = [None] * (new_level + 1)
+    else:
+      new_node = SkipNode(key, value, [None] * (new_level + 1))
+
+    # Splice the new node in after the node before it at each level. If that
+    # node was the last at this level, its next is None and we become the end
+    # of the list. The new node is now the node before any key that follows it
+    # at these levels, so it replaces them in `update` for the next insert.
+    new_next = new_node.next
+    for i in range(new_level + 1):
+      prev = update[i]
+      new_next[i] = prev.next[i]
+      prev.next[i] = new_node
+      update[i] = new_node
+    self.size += 1
+    return new_node
 
   def insert(self, key: K, value: V) -> 'SkipList':
     # Get the level we add the new node at.
@@ -114,33 +213,79 @@ class SkipList:
     # If our new level is more that we have seen before, add None pointers to
     # head node.
     if new_level > self.level:
+      self.head.next.extend([None] * (new_level - self.level))
       self.level = new_level
 
-    # Create a new node to hold K and V, it will be inserted at the newly
-    # choosen level,
-    new_node = SkipNode(Pair(key, value), {})
-    x = self.head
-
-    # We need to insert the new node into the linked list at each level.
-    for i in range(new_level, -1, -1):
-      # Most important part of this loop is that when we break from the while
-      # loop over the linked list, we will drop down a level (from the for loop)
-      # but we don't reset `x` so we are looking at the same node, just at a
-      # lower level. This means we get to skip looking at any node before `x`
-      # at this new level.
-      #
-      # Iterate through the until we hit the end or find a key that is less than
-      # what we are inserting.
-      while x.next.get(i) is not None and x.next[i].pair.key < key:
-        x = x.next[i]
-      # If we hit the end, x.next.get(i) is None and we are the largest key at
-      # this level. Set our next value to None (making us the end of the list)
-      # and set the pervious last node to point to us. In the other case
-      # x.next[i] is just a node and we do the same sort of setting.
-      new_node.next[i] = x.next.get(i)
-      x.next[i] = new_node
+    # Track the last node at each level that comes before our key, these are
+    # the nodes whose next pointers need to point to the new node.
+    #
+    # If our key goes right after the last inserted node (the finger), we
+    # already have these from the last insert. This makes in order inserts skip
+    # the descent.
+    finger = self._finger
+    if (
+        finger is not None and finger.key < key and
+        (finger.next[0] is None or key < finger.next[0].key)):
+      update = self._finger_update
+      # The head is the node before us at any levels we just added.
+      update.extend([self.head] * (self.level + 1 - len(update)))
+    else:
+      update = self._descend(key)
+
+    new_node = self._link(key, value, new_level, update)
+    self._finger = new_node
+    self._finger_update = update
+    return self
 
-    self.size += 1
+  def bulk_insert(self, items: Iterable[Tuple[K, V]]) -> 'SkipList':
+    """Insert many key value pairs in a single pass through the list.
+
+    The items are sorted first, so each key goes after the one before it. The
+    nodes we linked the last key after are still before the next key, so rather
+    than descending from the top for each key we climb up from the bottom of
+    that path only as far as we need to get past the nodes in between.
+    """
+    head = self.head
+    update = [head] * (self.level + 1)
+    # Bind these once, they are used for every item.
+    get_level, link = self.get_level, self._link
+    new_node = None
+    for key, value in sorted(items, key=operator.itemgetter(0)):
+      new_level = get_level()
+      top = self.level
+      if new_level > top:
+        head.next.extend([None] * (new_level - top))
+        update.extend([head] * (new_level - top))
+        self.level = top = new_level
+
+      # Climb while the node after `update[i]` at this level is still before our
+      # key. Once it isn't, `update` is already right for this level and every
+      # level above it, as any node in the way would also be in this level.
+      i = 0
+      while i <= top:
+        nxt = update[i].next[i]
+        if nxt is None or not nxt.key < key:
+          break
+        i += 1
+
+      # Every level below `i` needs to move forward, search down through them
+      # as in `_descend`. When all of them do, start from the top level.
+      if i:
+        x = update[min(i, top)]
+        for i in range(min(i - 1, top), -1, -1):
+          nxt = x.next[i]
+          while nxt is not None and nxt.key < key:
+            x = nxt
+            nxt = x.next[i]
+          update[i] = x
+
+      new_node = link(key, value, new_level, update)
+
+    # `update` is now the path to the last node we inserted, so it becomes the
+    # finger.
+    if new_node is not None:
+      self._finger = new_node
+      self._finger_update = update
     return self
 
   def delete(self, key: K) -> 'SkipList':
@@ -155,64 +300,73 @@ class SkipList:
       # but we don't reset `x` so we are looking at the same node, just at a
       # lower level. This means we get to skip looking at any node before `x`
       # at this new level.
-      while True:
-        # Iterate through until we find hit the end of the list or we find a key
-        # larget than us, this means we need to go down a level.
-        if x.next.get(i) is None or key < x.next[i].pair.key:
-          break
-        # If we find the next node is the key to delete, we delete it by moving
-        # our next pointer to the one after that. Then in the next loop, the
-        # next node will have a key that is larger than ours and we will break,
-        # making us go to the next level down where we will find our key again.
-        # x.next[i] is safe to access because if it was not there we would have
-        # broken before.
-        elif x.next[i].pair.key == key:
-          deleted = True
-          x.next[i] = x.next[i].next.get(i)
-        # Move on if need be
-        else:
-          x = x.next[i]
-
-    # We deleted a key, so make the size smaller.
+      #
+      # Iterate through until we hit the end of the list or we find a key that
+      # is not smaller than ours.
+      nxt = x.next[i]
+      while nxt is not None and nxt.key < key:
+        x = nxt
+        nxt = x.next[i]
+      # If the next node is the key to delete, we delete it by moving our next
+      # pointer to the one after that. Then we go to the next level down where
+      # we will find our key again.
+      while nxt is not None and nxt.key == key:
+        deleted = True
+        node, nxt = nxt, nxt.next[i]
+        x.next[i] = nxt
+        # Every node is in the bottom list, so this is where each deleted node
+        # is unlinked for the last time.
+        if i == 0:
+          self._release(node)
+
+    # We deleted a key, so make the size smaller. The finger could point at
+    # the deleted node, so drop it.
     if deleted:
       self.size -= 1
+      self._finger = None
+
+    # If we removed the only nodes in the top levels, drop them so later
+    # searches don't walk empty lists.
+    while self.level > 0 and self.head.next[self.level] is None:
+      self.head.next.pop()
+      self.level -= 1
 
     return self
 
+  def _release(self, node: SkipNode):
+    """Return a deleted node to the pool, dropping its references."""
+    if len(self._pool) < self._max_pool_size:
+      node.key = node.value = None
+      node.next.clear()
+      self._pool.append(node)
+
   def __str__(self) -> str:
     """Print the skip list on a grid to show the skips better."""
-    # Track which column a key will appear in the grid
-    location = {}
-    rows = []
+    # The bottom level has every node, so a node's position in it is the
+    # column it appears in at every level. Stringify each key once here.
+    column = {}
+    key_strs = []
+    x = self.head.next[0]
+    while x is not None:
+      column[id(x)] = len(key_strs)
+      key_strs.append(str(x.key))
+      x = x.next[0]
     # Track the longest string representation of a key to make the grid even.
-    max_len = 0
-    # We know there will be self.level rows in the grid
-    # Start at the bottom as it will have every key and sets locations for
-    # higher levels.
+    max_len = max(map(len, key_strs), default=0)
+
+    # We know there will be self.level rows in the grid, each level just fills
+    # in the columns of the nodes in that level.
+    rows = []
     for i in range(self.level + 1):
-      # We know there will be self.size columns in the grid.
-      row = [None for _ in range(self.size)]
+      row = [None] * len(key_strs)
       x = self.head.next[i]
-      # Track the current column.
-      j = 0
-      # Iterate until we hit the end of the list
       while x is not None:
-        # Get the saved location if possible, otherwise get the current count
-        j = location.get(x.pair.key, j)
-        # Save the column number of this key.
-        location[x.pair.key] = j
-        # Place the key in the grid, according to the column, this places higher
-        # level keys in the right columns,
-        row[location[x.pair.key]] = x.pair.key
-        # If this has the longest string representation, update it
-        if (l := len(str(x.pair.key))) > max_len:
-          max_len = l
-        # Move to the next node (or None at the end) and update the column.
-        x = x.next.get(i)
-        j += 1
+        j = column[id(x)]
+        row[j] = key_strs[j]
+        x = x.next[i]
       rows.append(row)
 
-    def _format_key(key: Optional[K], max_len: int) -> str:
+    def _format_key(key: Optional[str], max_len: int) -> str:
       if key is not None:
         return f"-> {key:>{max_len}}"
       return "   " + " " * max_len
@@ -226,6 +380,289 @@ class SkipList:
     return "\n".join(lines)
 
 
+@dataclasses.dataclass
+class SkipLeaf:
+  """A node in the B-skiplist, holding a sorted block of keys and values.
+
+  The first key is the pivot of the leaf, the tower of `next` pointers above the
+  leaf is ordered by it. `next[0]` is the next leaf.
+  """
+  __slots__ = ("keys", "values", "next")
+  keys: List[K]
+  values: List[V]
+  next: List[Optional['SkipLeaf']]  # Indexed by level, len - 1 is the level.
+
+  @property
+  def level(self) -> int:
+    return len(self.next) - 1
+
+
+@dataclasses.dataclass
+class BSkipList:
+  """B-skiplist.
+
+  A skiplist where the bottom level is widened into leaves that each hold up to
+  `block_size` sorted keys. Horizontal moves at the bottom become a `bisect` of
+  a short list rather than a pointer hop per key, so there are about
+  `block_size` times fewer nodes to chase. Leaves are split in half when they
+  overflow. Unlike `SkipList`, inserting an existing key replaces its value.
+  """
+
+  head: SkipLeaf
+  level: int
+  size: int
+  block_size: int = 16
+
+  def __len__(self):
+    """The length of the list is tracked with size."""
+    return self.size
+
+  get_level = SkipList.get_level
+
+  def _descend(self, k: K) -> List[SkipLeaf]:
+    """Find the last leaf at each level whose pivot is smaller than `k`."""
+    update = [self.head] * (self.level + 1)
+    x = self.head
+    for i in range(self.level, -1, -1):
+      nxt = x.next[i]
+      while nxt is not None and nxt.keys[0] < k:
+        x = nxt
+        nxt = x.next[i]
+      update[i] = x
+    return update
+
+  @staticmethod
+  def _leaf_for(update: List[SkipLeaf], k: K) -> SkipLeaf:
+    """The leaf that would hold `k`, the last one with a pivot <= `k`."""
+    nxt = update[0].next[0]
+    if nxt is not None and nxt.keys[0] == k:
+      return nxt
+    return update[0]
+
+  def __getitem__(self, k: K) -> V:
+    # The tower search is the same as `SkipList`, except we stop at the last
+    # leaf whose pivot is <= k instead of at a single key.
+    x = self.head
+    for i in range(self.level, -1, -1):
+      nxt = x.next[i]
+      while nxt is not None and not k < nxt.keys[0]:
+        x = nxt
+        nxt = x.next[i]
+    # Binary search the leaf, its keys are sorted.
+    j = bisect.bisect_left(x.keys, k)
+    if j < len(x.keys) and x.keys[j] == k:
+      return x.values[j]
+    raise KeyError(k)
+
+  def _add_leaf(
+      self, keys: List[K], values: List[V], update: List[SkipLeaf]):
+    """Link a new leaf in after the nodes in `update` at a random level."""
+    new_level = self.get_level()
+    if new_level > self.level:
+      self.head.next.extend([None] * (new_level - self.level))
+      update.extend([self.head] * (new_level - self.level))
+      self.level = new_level
+    leaf = SkipLeaf(keys, values, [None] * (new_level + 1))
+    leaf_next = leaf.next
+    for i in range(new_level + 1):
+      prev = update[i]
+      leaf_next[i] = prev.next[i]
+      prev.next[i] = leaf
+
+  def insert(self, key: K, value: V) -> 'BSkipList':
+    update = self._descend(key)
+    leaf = self._leaf_for(update, key)
+    if leaf is self.head:
+      # Our key is smaller than every pivot so it goes at the front of the first
+      # leaf, becoming its new pivot. If there are no leaves yet, make one.
+      leaf = self.head.next[0]
+      if leaf is None:
+        self._add_leaf([key], [value], update)
+        self.size += 1
+        return self
+
+    # Find where our key goes in the leaf.
+    j = bisect.bisect_left(leaf.keys, key)
+    if j < len(leaf.keys) and leaf.keys[j] == key:
+      leaf.values[j] = value
+      return self
+    leaf.keys.insert(j, key)
+    leaf.values.insert(j, value)
+    self.size += 1
+
+    if len(leaf.keys) > self.block_size:
+      # Move the upper half of the keys into a new leaf right after this one.
+      # Nothing sits between the two leaves, so at each level this leaf is part
+      # of, it is the predecessor of the new one.
+      mid = len(leaf.keys) // 2
+      keys, values = leaf.keys[mid:], leaf.values[mid:]
+      del leaf.keys[mid:]
+      del leaf.values[mid:]
+      for i in range(leaf.level + 1):
+        update[i] = leaf
+      self._add_leaf(keys, values, update)
+    return self
+
+  def delete(self, key: K) -> 'BSkipList':
+    update = self._descend(key)
+    leaf = self._leaf_for(update, key)
+
+    j = bisect.bisect_left(leaf.keys, key)
+    if j == len(leaf.keys) or leaf.keys[j] != key:
+      return self
+    del leaf.keys[j]
+    del leaf.values[j]
+    self.size -= 1
+
+    if not leaf.keys:
+      # The leaf was only holding our key so it was its pivot, this means
+      # `update` has the leaf's predecessor at each level. Unlink it.
+      for i, nxt in enumerate(leaf.next):
+        update[i].next[i] = nxt
+    return self
+
+
+# The number of next pointers stored for each node in `IntSkipList`.
+_LEVELS = MAX_LEVEL + 1
+
+
+@_jit
+def _find(keys, nexts, level, k):
+  """Find the index of the node holding `k` in an `IntSkipList`, -1 if missing.
+
+  This is the same search as `SkipList.__getitem__` but over flat arrays. The
+  head is node 0 and `nexts[x * _LEVELS + i]` is the next node after `x` at
+  level `i`, with -1 as the end of the list.
+  """
+  x = 0
+  for i in range(level, -1, -1):
+    nxt = nexts[x * _LEVELS + i]
+    while nxt != -1 and keys[nxt] < k:
+      x = nxt
+      nxt = nexts[x * _LEVELS + i]
+    if nxt != -1 and keys[nxt] == k:
+      return nxt
+  return -1
+
+
+@_jit
+def _insert(keys, nexts, level, node, new_level):
+  """Link `node` into the lists of an `IntSkipList` up to `new_level`."""
+  k = keys[node]
+  x = 0
+  for i in range(level, -1, -1):
+    nxt = nexts[x * _LEVELS + i]
+    while nxt != -1 and keys[nxt] < k:
+      x = nxt
+      nxt = nexts[x * _LEVELS + i]
+    if i <= new_level:
+      nexts[node * _LEVELS + i] = nxt
+      nexts[x * _LEVELS + i] = node
+
+
+@_jit
+def _delete(keys, nexts, level, k):
+  """Unlink every node holding `k` from an `IntSkipList`.
+
+  Returns the first unlinked node, or -1 if `k` was missing. The unlinked nodes
+  still point to each other at level 0, so the caller can walk from it to find
+  the rest.
+  """
+  x = 0
+  first = -1
+  for i in range(level, -1, -1):
+    nxt = nexts[x * _LEVELS + i]
+    while nxt != -1 and keys[nxt] < k:
+      x = nxt
+      nxt = nexts[x * _LEVELS + i]
+    if i == 0 and nxt != -1 and keys[nxt] == k:
+      first = nxt
+    while nxt != -1 and keys[nxt] == k:
+      nxt = nexts[nxt * _LEVELS + i]
+      nexts[x * _LEVELS + i] = nxt
+  return first
+
+
+def _empty_tower() -> array.array:
+  return array.array("i", [-1] * _LEVELS)
+
+
+@dataclasses.dataclass
+class IntSkipList:
+  """Skiplist with int keys, stored as parallel arrays.
+
+  Nodes are indices into `keys` (int64) and `values`, with the head at index 0.
+  Each node has `_LEVELS` slots in `nexts` (int32) holding the index of the next
+  node at that level. With everything in flat arrays the search loops can be
+  compiled with numba when it is available.
+  """
+
+  keys: array.array = dataclasses.field(
+      default_factory=lambda: array.array("q", [0]))
+  values: List[V] = dataclasses.field(default_factory=lambda: [None])
+  nexts: array.array = dataclasses.field(default_factory=_empty_tower)
+  level: int = 0
+  size: int = 0
+  # Indices of deleted nodes that insert can reuse.
+  free: List[int] = dataclasses.field(default_factory=list)
+
+  def __len__(self):
+    """The length of the list is tracked with size."""
+    return self.size
+
+  get_level = SkipList.get_level
+
+  # Keys go through `operator.index` so the compiled loops only ever compare
+  # ints, anything that isn't an int is rejected with a TypeError.
+  def __getitem__(self, k: int) -> V:
+    node = _find(self.keys, self.nexts, self.level, operator.index(k))
+    if node == -1:
+      raise KeyError(k)
+    return self.values[node]
+
+  def __contains__(self, k: int) -> bool:
+    return _find(self.keys, self.nexts, self.level, operator.index(k)) != -1
+
+  def get(self, k: int, default: Optional[V] = None) -> Optional[V]:
+    """Get the value for `k`, returning `default` if it is missing."""
+    node = _find(self.keys, self.nexts, self.level, operator.index(k))
+    return default if node == -1 else self.values[node]
+
+  def insert(self, key: int, value: V) -> 'IntSkipList':
+    key = operator.index(key)
+    new_level = self.get_level()
+    if new_level > self.level:
+      self.level = new_level
+    # Reuse a deleted node if we have one, otherwise add the new node to the end
+    # of the arrays. Then link it in.
+    if self.free:
+      node = self.free.pop()
+      self.keys[node] = key
+      self.values[node] = value
+    else:
+      node = len(self.keys)
+      self.keys.append(key)
+      self.values.append(value)
+      self.nexts.extend(_empty_tower())
+    _insert(self.keys, self.nexts, self.level, node, new_level)
+    self.size += 1
+    return self
+
+  def delete(self, key: int) -> 'IntSkipList':
+    key = operator.index(key)
+    node = _delete(self.keys, self.nexts, self.level, key)
+    # Walk the unlinked nodes, clearing their pointers and freeing them.
+    while node != -1 and self.keys[node] == key:
+      start = node * _LEVELS
+      nxt = self.nexts[start]
+      self.nexts[start:start + _LEVELS] = _empty_tower()
+      self.values[node] = None
+      self.free.append(node)
+      self.size -= 1
+      node = nxt
+    return self
+
+
 # Simple demo.
 if __name__ == "__main__":
   from skip_list_test import make_example_list
@@ -1,33 +1,24 @@
 #!/usr/bin/env python3
 
+import functools
+import random
 import types
 import skip_list
-from skip_list import Pair, SkipList, SkipNode
+from skip_list import BSkipList, IntSkipList, SkipLeaf, SkipList, SkipNode
 
 import pytest
 parameterize = pytest.mark.parametrize
 
 
 def make_example_list():
-  _24 = SkipNode(Pair(24, "24!"), [None, None, None])
-  _19 = SkipNode(Pair(19, "19!"), [_24])
-  _15 = SkipNode(Pair(15, "15!"), [_19, _24])
-  _12 = SkipNode(Pair(12, "12!"), [_15])
-  _7 = SkipNode(Pair(7, "7!"), [_12])
-  _5 = SkipNode(Pair(5, "5!"), [_7, _15, _24])
-  _1 = SkipNode(Pair(1, "1!"), [_5])
-  _head = SkipNode(Pair(None, None), [_1, _5, _5])
-  return SkipList(_head, 2, 7)
-
-def make_example_list():
-  _24 = SkipNode(Pair(24, "24!"), {})
-  _19 = SkipNode(Pair(19, "19!"), {0: _24})
-  _15 = SkipNode(Pair(15, "15!"), {0: _19, 1: _24})
-  _12 = SkipNode(Pair(12, "12!"), {0: _15})
-  _7 = SkipNode(Pair(7, "7!"), {0: _12})
-  _5 = SkipNode(Pair(5, "5!"), {0: _7, 1: _15, 2: _24})
-  _1 = SkipNode(Pair(1, "1!"), {0: _5})
-  _head = SkipNode(Pair(None, None), {0: _1, 1: _5, 2: _24})
+  _24 = SkipNode(24, "24!", [None, None, None])
+  _19 = SkipNode(19, "19!", [_24])
+  _15 = SkipNode(15, "15!", [_19, _24])
+  _12 = SkipNode(12, "12!", [_15])
+  _7 = SkipNode(7, "7!", [_12])
+  _5 = SkipNode(5, "5!", [_7, _15, _24])
+  _1 = SkipNode(1, "1!", [_5])
+  _head = SkipNode(None, None, [_1, _5, _5])
   return SkipList(_head, 2, 7)
 
 example_list = pytest.fixture(make_example_list)
@@ -57,3 +48,252 @@ def test_delete(example_list, to_delete):
 @parameterize("to_find", (1, 5, 15, 12, 24))
 def test_find(example_list, to_find):
   assert example_list[to_find] == f"{to_find}!"
+
+
+@parameterize(
+    "key,expected",
+    ((1, True), (15, True), (24, True), (0, False), (14, False), (100, False)))
+def test_contains(example_list, key, expected):
+  assert (key in example_list) is expected
+
+
+def test_get(example_list):
+  assert example_list.get(7) == "7!"
+  assert example_list.get(14) is None
+  assert example_list.get(14, "missing") == "missing"
+
+
+@parameterize(
+    "lo,hi,expected",
+    ((5, 15, [5, 7, 12]), (6, 16, [7, 12, 15]), (0, 2, [1]), (25, 30, []),
+     (0, 100, [1, 5, 7, 12, 15, 19, 24])))
+def test_items_range(example_list, lo, hi, expected):
+  items = list(example_list.items_range(lo, hi))
+  assert items == [(k, f"{k}!") for k in expected]
+
+
+def test_delete_drops_empty_levels(example_list):
+  example_list = example_list.delete(24)
+  assert example_list.level == 2
+  example_list = example_list.delete(5)
+  assert example_list.level == 1
+  assert len(example_list.head.next) == 2
+  example_list = example_list.delete(15)
+  assert example_list.level == 0
+  assert example_list[19] == "19!"
+  for key in (1, 7, 12, 19):
+    example_list = example_list.delete(key)
+  assert example_list.level == 0
+  assert example_list.head.next == [None]
+
+
+def test_delete_reuses_node(example_list, monkeypatch):
+  # The pool is shared by every SkipList, start from an empty one.
+  monkeypatch.setattr(SkipList, "_pool", [])
+  node = example_list.head.next[0]
+  example_list = example_list.delete(1)
+  assert SkipList._pool[-1] is node
+  assert node.key is None and node.value is None and node.next == []
+  example_list = example_list.insert(14, "14!")
+  assert node.key == 14
+  assert example_list[14] == "14!"
+
+
+def test_insert_in_order_uses_finger():
+  sl = SkipList(SkipNode(None, None, [None]), 0, 0)
+  sl = sl.insert(0, "0!")
+  # In order inserts after the first never need to descend.
+  sl._descend = None
+  for key in range(1, 100):
+    sl = sl.insert(key, f"{key}!")
+    assert sl._finger.key == key
+  assert len(sl) == 100
+  assert list(sl.items_range(0, 100)) == [(k, f"{k}!") for k in range(100)]
+
+
+def test_insert_after_delete(example_list):
+  example_list = example_list.insert(25, "25!").delete(25).insert(26, "26!")
+  assert 25 not in example_list
+  assert example_list[26] == "26!"
+  assert example_list[24] == "24!"
+
+
+def test_bulk_insert(example_list):
+  items = [(k, f"{k}!") for k in (30, 0, 14, 6, 20, 13, 25, 2)]
+  example_list = example_list.bulk_insert(items)
+  assert len(example_list) == 15
+  expected = sorted([1, 5, 7, 12, 15, 19, 24] + [k for k, _ in items])
+  assert list(example_list.items_range(0, 100)) == [
+      (k, f"{k}!") for k in expected]
+
+
+def test_bulk_insert_empty():
+  sl = SkipList(SkipNode(None, None, [None]), 0, 0)
+  keys = list(range(200))
+  random.Random(0).shuffle(keys)
+  sl = sl.bulk_insert((k, k * 2) for k in keys)
+  assert len(sl) == 200
+  assert list(sl.items_range(0, 200)) == [(k, k * 2) for k in range(200)]
+  # The finger is left on the last key so appending keeps working.
+  sl = sl.insert(200, 400)
+  assert sl[200] == 400
+
+
+@functools.total_ordering
+class CountingKey:
+  """An int key that counts how many times it is compared."""
+  compares = 0
+
+  def __init__(self, value):
+    self.value = value
+
+  def __lt__(self, other):
+    CountingKey.compares += 1
+    return self.value < other.value
+
+  def __eq__(self, other):
+    return self.value == other.value
+
+
+def test_bulk_insert_saves_compares():
+  existing = range(0, 1000, 2)
+  def compares(bulk):
+    random.seed(0)
+    sl = SkipList(SkipNode(None, None, [None]), 0, 0)
+    sl.bulk_insert((CountingKey(k), k) for k in existing)
+    items = [(CountingKey(k), k) for k in range(1, 1000, 2)]
+    CountingKey.compares = 0
+    if bulk:
+      sl.bulk_insert(items)
+    else:
+      for key, value in items:
+        sl.insert(key, value)
+    count = CountingKey.compares
+    x, keys = sl.head.next[0], []
+    while x is not None:
+      keys.append(x.value)
+      x = x.next[0]
+    assert keys == list(range(1000))
+    return count
+  # Both insert the same sorted items into the same list with the same levels,
+  # so the only difference is how much searching they do. Each key goes
+  # between two existing ones, so the insert finger never applies.
+  assert compares(bulk=True) < compares(bulk=False)
+
+
+def test_get_level(example_list):
+  for _ in range(1000):
+    assert 0 <= example_list.get_level() <= skip_list.MAX_LEVEL
+
+
+def make_example_b_list():
+  b_list = BSkipList(SkipLeaf([], [], [None]), 0, 0, block_size=4)
+  keys = list(range(0, 100, 3))
+  random.Random(42).shuffle(keys)
+  for key in keys:
+    b_list.insert(key, f"{key}!")
+  return b_list
+
+example_b_list = pytest.fixture(make_example_b_list)
+
+
+def test_b_list_splits_leaves(example_b_list):
+  assert len(example_b_list) == 34
+  leaf = example_b_list.head.next[0]
+  keys = []
+  while leaf is not None:
+    assert 0 < len(leaf.keys) <= example_b_list.block_size
+    keys.extend(leaf.keys)
+    leaf = leaf.next[0]
+  assert keys == list(range(0, 100, 3))
+
+
+@parameterize("to_find", (0, 3, 48, 99))
+def test_b_list_find(example_b_list, to_find):
+  assert example_b_list[to_find] == f"{to_find}!"
+
+
+@parameterize("missing", (-1, 1, 50, 100))
+def test_b_list_find_missing_key(example_b_list, missing):
+  with pytest.raises(KeyError):
+    example_b_list[missing]
+
+
+@parameterize("key", (-5, 14, 100))
+def test_b_list_insert(example_b_list, key):
+  example_b_list = example_b_list.insert(key, "my value")
+  assert example_b_list[key] == "my value"
+  assert len(example_b_list) == 35
+
+
+def test_b_list_insert_replaces(example_b_list):
+  example_b_list = example_b_list.insert(3, "new")
+  assert example_b_list[3] == "new"
+  assert len(example_b_list) == 34
+
+
+def test_b_list_delete(example_b_list):
+  keys = list(range(0, 100, 3))
+  for key in keys:
+    example_b_list = example_b_list.delete(key)
+    with pytest.raises(KeyError):
+      example_b_list[key]
+  assert len(example_b_list) == 0
+  assert all(n is None for n in example_b_list.head.next)
+
+
+def make_example_int_list():
+  int_list = IntSkipList()
+  for key in (12, 1, 24, 7, 19, 5, 15):
+    int_list.insert(key, f"{key}!")
+  return int_list
+
+example_int_list = pytest.fixture(make_example_int_list)
+
+
+def test_int_list_find_missing_key(example_int_list):
+  with pytest.raises(KeyError):
+    example_int_list[100]
+
+
+@parameterize("level", (0, 1, 2, 6))
+def test_int_list_insert(example_int_list, level):
+  key = 14
+  value = "my value"
+  example_int_list.get_level = types.MethodType(
+      lambda self: level, example_int_list)
+  example_int_list = example_int_list.insert(key, value)
+  assert example_int_list[key] == value
+  assert len(example_int_list) == 8
+
+
+@parameterize("to_find", (1, 5, 15, 12, 24))
+def test_int_list_find(example_int_list, to_find):
+  assert example_int_list[to_find] == f"{to_find}!"
+
+
+@parameterize("to_delete", (1, 5, 15, 12, 24, 100))
+def test_int_list_delete(example_int_list, to_delete):
+  example_int_list = example_int_list.delete(to_delete)
+  assert to_delete not in example_int_list
+  with pytest.raises(KeyError):
+    example_int_list[to_delete]
+  assert len(example_int_list) == (7 if to_delete == 100 else 6)
+
+
+def test_int_list_delete_reuses_node(example_int_list):
+  nodes = len(example_int_list.keys)
+  example_int_list = example_int_list.delete(7).insert(8, "8!")
+  assert len(example_int_list.keys) == nodes
+  assert example_int_list[8] == "8!"
+  assert 7 not in example_int_list
+
+
+def test_int_list_get(example_int_list):
+  assert example_int_list.get(7) == "7!"
+  assert example_int_list.get(14, "missing") == "missing"
+
+
+def test_int_list_rejects_non_int(example_int_list):
+  with pytest.raises(TypeError):
+    example_int_list.insert(1.5, "float")